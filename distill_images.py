@@ -1,8 +1,19 @@
 import os
-import shutil
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import List, Optional
 
+from fastcopy import fast_copy
+
+
+def copy_image(src_path: str, dest_path: str) -> None:
+    try:
+        fast_copy(src_path, dest_path)
+        print(f"Copied: {src_path} -> {dest_path}")
+    except Exception as e:
+        print(f"Error copying {src_path} to {dest_path}: {e}")
+
 
 # Function to gather every nth image from multiple folders
 # and copy them to an output folder
@@ -10,7 +21,8 @@ def distill_images(
     input_folders: List[str],
     n: int,
     offset: Optional[int],
-    output_folder: str
+    output_folder: str,
+    jobs: int = 8
 ) -> None:
     os.makedirs(output_folder, exist_ok=True)
 
@@ -22,14 +34,15 @@ def distill_images(
             print(f"Skipping non-existent folder: {folder}")
             continue
 
-        images = sorted([f for f in os.listdir(folder) if os.path.isfile(os.path.join(folder, f))])
-        selected_images = images[offset::n]  # Take every nth image
+        images = sorted(e.name for e in os.scandir(folder) if e.is_file())
 
-        for image in selected_images:
-            src_path = os.path.join(folder, image)
-            dest_path = os.path.join(output_folder, image)
-            shutil.copy2(src_path, dest_path)
-            print(f"Copied: {src_path} -> {dest_path}")
+        # Copy in parallel: the copies are independent and mostly I/O wait.
+        # islice picks every nth image without materializing a second list.
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            for image in islice(images, offset, None, n):
+                src_path = os.path.join(folder, image)
+                dest_path = os.path.join(output_folder, image)
+                executor.submit(copy_image, src_path, dest_path)
 
 
 if __name__ == "__main__":
@@ -37,7 +50,8 @@ if __name__ == "__main__":
     parser.add_argument("--input-folders", nargs='+', required=True, help="List of input folders.")
     parser.add_argument("-n", type=int, required=True, help="Take every nth image.")
     parser.add_argument("-o", type=int, required=False, help="offset")
+    parser.add_argument("--jobs", type=int, default=8, help="Number of parallel copy threads (default: 8)")
     parser.add_argument("--output-folder", required=True, help="Folder where selected images will be copied.")
 
     args = parser.parse_args()
-    distill_images(args.input_folders, args.n, args.o, args.output_folder)
+    distill_images(args.input_folders, args.n, args.o, args.output_folder, args.jobs)
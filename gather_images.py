@@ -16,27 +16,137 @@ import os
 import sys
 import argparse
 import configparser
+import functools
 import hashlib
-import shutil
+import mmap
+import queue
+import socket
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 import re
 
+from fastcopy import fast_copy, fadvise, FADV_SEQUENTIAL, FADV_DONTNEED
+
+# BLAKE3 (pip install blake3) hashes several times faster than SHA-256 and
+# can use multiple cores on a single file; fall back to SHA-256 without it
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+# Which algorithm get_file_hash produces - cached digests from a different
+# algorithm must not be mixed into the dedup map
+HASH_ALGORITHM = 'blake3' if blake3 is not None else 'sha256'
+
+# Hashing reads 1 MiB at a time; files above PIPELINE_THRESHOLD are read on a
+# helper thread so disk I/O overlaps with hashing (double buffering), and
+# files above MMAP_THRESHOLD are memory-mapped and hashed in a single update
+HASH_CHUNK_SIZE = 1 << 20
+PIPELINE_THRESHOLD = 4 * 1024 * 1024
+MMAP_THRESHOLD = 16 * 1024 * 1024
+
+# Linux kernel crypto API (AF_ALG): sendfile splices the file straight into
+# the kernel's (hardware-accelerated) SHA-256 with zero userspace copies.
+# A sendfile call finalizes the digest, so only files that fit in a single
+# call take this path.
+AFALG_MIN_SIZE = 1 << 20
+AFALG_MAX_SIZE = 0x7ffff000
+
+# Per-file progress messages are buffered and written in batches - one
+# write() per batch instead of one per copied file
+LOG_FLUSH_EVERY = 256
+
+
+# Filename patterns are matched once per candidate file - compile them once
+# and memoize the (pure) helpers, since the same names recur across folders.
+# The format check uses one anchored pattern per name flavor: the previous
+# combined [W0-9][A0-9] alternation wrongly accepted names like
+# "20250101-7A1234" or "20250101_WW1234"
+_DATE_RE = re.compile(r'^(\d{4})(\d{2})(\d{2})')
+_DATE_PART = r'^\d{4}(0[1-9]|1[0-2])(0[1-9]|[12][0-9]|3[01])'
+_WA_RE = re.compile(_DATE_PART + r'-WA\d{4}\.(jpg|mp4)$')
+_TIMESTAMP_RE = re.compile(_DATE_PART + r'_\d{6}')
+
+
+@functools.lru_cache(maxsize=65536)
+def _date_from_name(filename: str) -> Optional[datetime]:
+    """Extract a date from a YYYYMMDD-prefixed filename, or None."""
+    match = _DATE_RE.search(filename)
+    if match:
+        try:
+            return datetime(int(match.group(1)), int(match.group(2)), int(match.group(3)))
+        except ValueError:
+            pass
+    return None
+
+
+@functools.lru_cache(maxsize=65536)
+def _filename_format_ok(filename: str) -> bool:
+    if not filename.endswith(('.jpg', '.mp4')):
+        return False
+    return bool(_WA_RE.match(filename) or _TIMESTAMP_RE.match(filename))
+
+
+def afalg_sha256_available() -> bool:
+    """Check whether the kernel exposes SHA-256 via an AF_ALG socket."""
+    if not hasattr(socket, 'AF_ALG'):
+        return False
+    try:
+        with socket.socket(socket.AF_ALG, socket.SOCK_SEQPACKET, 0) as sock:
+            sock.bind(("hash", "sha256"))
+        return True
+    except OSError:
+        return False
+
 
 class GatherImages:
     """Main class for organizing media files."""
 
-    def __init__(self, config_path: str):
+    def __init__(self, config_path: str, jobs: int = 8):
         """Initialize the organizer with configuration."""
         self.config = configparser.ConfigParser()
         self.config.read(config_path)
 
+        # Copies and hashing run on thread pools (created in run()) to
+        # overlap I/O wait; hashlib releases the GIL during updates
+        self.jobs = jobs
+        self._copy_pool: Optional[ThreadPoolExecutor] = None
+        self._hash_pool: Optional[ThreadPoolExecutor] = None
+        self._stats_lock = threading.Lock()
+        self._dest_lock = threading.Lock()
+
+        # Existing names per destination directory, scanned once and kept
+        # current as names are reserved - avoids per-candidate stat() probes
+        self._dir_names: Dict[str, set] = {}
+
+        # Destination directories already created this run
+        self._ensured_dirs: set = set()
+
+        # Buffered per-file progress output
+        self._log_buf: List[str] = []
+        self._log_lock = threading.Lock()
+
+        # Persistent digest cache (opened in run()): gathering is rerun with
+        # new date ranges over the same folders, so most digests can be
+        # reused across runs as long as size and mtime are unchanged
+        self._hash_cache: Optional[sqlite3.Connection] = None
+        self._cache_lock = threading.Lock()
+
         # File extensions for different media types (however we warn for anything else than jpg and mp4)
         self.image_extensions = {'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp'}
         self.video_extensions = {'.mp4', '.avi', '.mkv', '.mov', '.wmv', '.flv', '.webm', '.m4v'}
 
-        # Hash storage for duplicate detection
-        self.file_hashes: Dict[str, str] = {}
+        # Duplicate detection: files are first bucketed by size, content
+        # hashes are only computed once a second file with the same size shows
+        # up. The hash index is keyed on the first 8 digest bytes as an int -
+        # digests are already uniformly random, so re-hashing a 64-char hex
+        # string through the dict would be wasted work. The full digest is
+        # kept in the value to rule out first-word collisions.
+        self.size_index: Dict[int, List[str]] = {}
+        self.hash_index: Dict[int, Tuple[bytes, str]] = {}
 
         # Statistics
         self.stats = {
@@ -52,35 +162,250 @@ class GatherImages:
         # Warnings
         self.warnings: List[str] = []
 
+        # Hardware-accelerated SHA-256 (SHA-NI etc.) is only reached when
+        # hashlib is backed by OpenSSL - warn early if that's not the case
+        if blake3 is None and type(self._new_hasher()).__module__ != '_hashlib':
+            print("Warning: hashlib SHA-256 is not OpenSSL-backed, "
+                  "hashing will be slow (consider 'pip install blake3')")
+
+        # Prefer the kernel crypto API for SHA-256 when BLAKE3 is missing
+        self._use_afalg = blake3 is None and afalg_sha256_available()
+
     def warn(self, message: str):
         """Log a warning message."""
         self.stats['warnings'] += 1
         self.warnings.append(message)
 
-    def get_file_hash(self, file_path: str) -> str:
-        """Calculate SHA-256 hash of a file."""
-        hash_sha256 = hashlib.sha256()
+    def log(self, message: str):
+        """Buffer a per-file progress message (flushed in batches)."""
+        with self._log_lock:
+            self._log_buf.append(message)
+            if len(self._log_buf) >= LOG_FLUSH_EVERY:
+                self._flush_log_locked()
+
+    def _flush_log_locked(self):
+        if self._log_buf:
+            sys.stdout.write("\n".join(self._log_buf) + "\n")
+            self._log_buf.clear()
+
+    def flush_log(self):
+        """Write out any buffered progress messages."""
+        with self._log_lock:
+            self._flush_log_locked()
+
+    def _open_hash_cache(self, base_dir: str):
+        """Open (or create) the digest cache database in the output base dir."""
+        cache_path = os.path.join(base_dir, '.gather_hash_cache.db')
+        schema = ("CREATE TABLE IF NOT EXISTS file_hashes ("
+                  "path TEXT PRIMARY KEY, size INTEGER, mtime REAL, "
+                  "algorithm TEXT, digest BLOB)")
+        try:
+            self._hash_cache = sqlite3.connect(cache_path, check_same_thread=False)
+            self._hash_cache.execute(schema)
+            columns = {row[1] for row in
+                       self._hash_cache.execute("PRAGMA table_info(file_hashes)")}
+            if 'algorithm' not in columns:
+                # Cache predates the algorithm column - its digests can't be
+                # attributed to an algorithm, so start over
+                self._hash_cache.execute("DROP TABLE file_hashes")
+                self._hash_cache.execute(schema)
+        except sqlite3.Error as e:
+            print(f"Warning: could not open hash cache {cache_path}: {e}")
+            self._hash_cache = None
+
+    def _close_hash_cache(self):
+        """Commit and close the digest cache, if open."""
+        if self._hash_cache is not None:
+            try:
+                self._hash_cache.commit()
+                self._hash_cache.close()
+            except sqlite3.Error as e:
+                print(f"Warning: could not save hash cache: {e}")
+            self._hash_cache = None
+
+    def _cached_digest(self, file_path: str, stat_result: os.stat_result) -> Optional[bytes]:
+        """Look up a previously computed digest; None on miss or stale entry."""
+        if self._hash_cache is None:
+            return None
+        with self._cache_lock:
+            row = self._hash_cache.execute(
+                "SELECT size, mtime, algorithm, digest FROM file_hashes WHERE path = ?",
+                (file_path,)).fetchone()
+        if (row and row[0] == stat_result.st_size and row[1] == stat_result.st_mtime
+                and row[2] == HASH_ALGORITHM):
+            return row[3]
+        return None
+
+    def _store_digest(self, file_path: str, stat_result: os.stat_result, digest: bytes):
+        """Remember a digest for future runs (committed at run end)."""
+        if self._hash_cache is None or not digest:
+            return
+        with self._cache_lock:
+            self._hash_cache.execute(
+                "INSERT OR REPLACE INTO file_hashes VALUES (?, ?, ?, ?, ?)",
+                (file_path, stat_result.st_size, stat_result.st_mtime,
+                 HASH_ALGORITHM, digest))
+
+    @staticmethod
+    def _hash_key(digest: bytes) -> int:
+        """Dedup map key: the first 8 digest bytes, already uniformly random."""
+        return int.from_bytes(digest[:8], 'little')
+
+    @staticmethod
+    def _new_hasher():
+        """Return a content hasher: BLAKE3 if installed, SHA-256 otherwise.
+
+        The hash is only used for equality, so usedforsecurity=False lets
+        hashlib skip FIPS-mode wrappers on builds that have them.
+        """
+        if blake3 is not None:
+            return blake3.blake3(max_threads=blake3.blake3.AUTO)
+        try:
+            return hashlib.new('sha256', usedforsecurity=False)
+        except TypeError:
+            return hashlib.sha256()
+
+    def get_file_hash(self, file_path: str) -> bytes:
+        """Calculate the content hash (raw digest) of a file.
+
+        Large files are read on a helper thread while the main thread hashes
+        the previous chunk, overlapping disk reads with the hash computation.
+        Digests are cached across runs keyed on (path, size, mtime).
+        """
         try:
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_sha256.update(chunk)
-            return hash_sha256.hexdigest()
+                fd = f.fileno()
+                stat_result = os.fstat(fd)
+                file_size = stat_result.st_size
+
+                digest = self._cached_digest(file_path, stat_result)
+                if digest is not None:
+                    return digest
+
+                fadvise(fd, FADV_SEQUENTIAL)
+                try:
+                    digest = None
+                    if self._use_afalg and AFALG_MIN_SIZE <= file_size <= AFALG_MAX_SIZE:
+                        try:
+                            digest = self._hash_afalg(fd, file_size)
+                        except OSError:
+                            pass  # fall through to the userspace paths
+                    if digest is None:
+                        hasher = self._new_hasher()
+                        if file_size > MMAP_THRESHOLD:
+                            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                                if hasattr(mm, 'madvise'):
+                                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                                hasher.update(mm)
+                        elif file_size > PIPELINE_THRESHOLD:
+                            self._hash_pipelined(f, hasher)
+                        else:
+                            for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+                                hasher.update(chunk)
+                        digest = hasher.digest()
+                finally:
+                    # Hashing a big tree shouldn't evict the rest of the page
+                    # cache - tell the kernel these pages won't be reused
+                    fadvise(fd, FADV_DONTNEED)
+
+            self._store_digest(file_path, stat_result, digest)
+            return digest
         except Exception as e:
             print(f"Error calculating hash for {file_path}: {e}")
-            return ""
+            return b""
+
+    @staticmethod
+    def _hash_afalg(file_fd: int, size: int) -> bytes:
+        """Hash a file in the kernel via an AF_ALG SHA-256 socket.
+
+        The file bytes never enter userspace: sendfile splices them into the
+        crypto socket, then the 32-byte digest is read back.
+        """
+        with socket.socket(socket.AF_ALG, socket.SOCK_SEQPACKET, 0) as alg:
+            alg.bind(("hash", "sha256"))
+            op, _ = alg.accept()
+            with op:
+                sent = os.sendfile(op.fileno(), file_fd, 0, size)
+                if sent != size:
+                    # A short sendfile already finalized the digest over a
+                    # prefix - let the caller use the userspace paths instead
+                    raise OSError(f"short sendfile to AF_ALG socket ({sent}/{size})")
+                return os.read(op.fileno(), 32)
+
+    @staticmethod
+    def _hash_pipelined(f, hasher):
+        """Feed f to hasher with reads running one chunk ahead on a thread."""
+        chunks: queue.Queue = queue.Queue(maxsize=2)
+
+        def read_ahead():
+            try:
+                while True:
+                    chunk = f.read(HASH_CHUNK_SIZE)
+                    chunks.put(chunk)
+                    if not chunk:
+                        break
+            except Exception as e:
+                chunks.put(e)
+
+        reader = threading.Thread(target=read_ahead, daemon=True)
+        reader.start()
+        while True:
+            chunk = chunks.get()
+            if isinstance(chunk, Exception):
+                reader.join()
+                raise chunk
+            if not chunk:
+                break
+            hasher.update(chunk)
+        reader.join()
+
+    def is_duplicate(self, entry: os.DirEntry) -> bool:
+        """Check if file is a duplicate based on size and hash.
+
+        Two files can only be identical if they have the same size, so hashing
+        is deferred until another file with the same size has been seen.
+        """
+        file_path = entry.path
+        try:
+            # DirEntry caches the stat result, so this is free on Linux
+            file_size = entry.stat().st_size
+        except OSError as e:
+            print(f"Error getting size of {file_path}: {e}")
+            return False
+
+        same_size = self.size_index.get(file_size)
+        if same_size is None:
+            # First file with this size: no duplicate possible, skip hashing
+            self.size_index[file_size] = [file_path]
+            return False
+
+        # Lazily hash the files of this size that were deferred earlier,
+        # together with the new file; hashing in parallel overlaps the I/O
+        to_hash = same_size + [file_path]
+        if self._hash_pool is not None and len(to_hash) > 1:
+            hashes = list(self._hash_pool.map(self.get_file_hash, to_hash))
+        else:
+            hashes = [self.get_file_hash(path) for path in to_hash]
+
+        file_hash = hashes.pop()
+        for deferred_path, deferred_hash in zip(same_size, hashes):
+            if deferred_hash:
+                self.hash_index.setdefault(self._hash_key(deferred_hash),
+                                           (deferred_hash, deferred_path))
+        same_size.clear()
 
-    def is_duplicate(self, file_path: str) -> bool:
-        """Check if file is a duplicate based on hash."""
-        file_hash = self.get_file_hash(file_path)
         if not file_hash:
             return False
 
-        if file_hash in self.file_hashes:
-            print(f"Duplicate found: {file_path} (original: {self.file_hashes[file_hash]})")
+        key = self._hash_key(file_hash)
+        known = self.hash_index.get(key)
+        if known is not None and known[0] == file_hash:
+            self.log(f"Duplicate found: {file_path} (original: {known[1]})")
             self.stats['duplicates'] += 1
             return True
 
-        self.file_hashes[file_hash] = file_path
+        if known is None:
+            self.hash_index[key] = (file_hash, file_path)
         return False
 
     def clean_filename(self, filename: str) -> str:
@@ -98,42 +423,39 @@ class GatherImages:
 
     def validate_filename_format(self, filename: str) -> bool:
         """Check if filename starts with YYYYMMDD_HHMMSS / YYMMDD-WAXXXX format and ends with .jpg or .mp4"""
-        pattern = r'^\d{4}(0[1-9]|1[0-2])(0[1-9]|[12][0-9]|3[01])[_-]([W0-9][A0-9]\d{4})'
-        if not filename.endswith(('.jpg', '.mp4')):
-            return False
-        return bool(re.match(pattern, filename))
-
-    def get_file_date(self, file_path: str) -> datetime:
-        """Extract date from filename or use file modification time."""
-        filename = os.path.basename(file_path)
-
-        # Try to extract date from filename (YYYYMMDD format)
-        date_pattern = r'^(\d{4})(\d{2})(\d{2})'
-        match = re.search(date_pattern, filename)
+        return _filename_format_ok(filename)
+
+    def is_in_date_range(self, entry: os.DirEntry, from_date: datetime, to_date: datetime) -> bool:
+        """Check if file is within the specified date range.
+
+        Files whose name carries a parseable YYYYMMDD prefix are decided on
+        that date alone - for a typical "gather last week" run most files are
+        out of range and get skipped without any further syscall. Only
+        unparseable names fall back to the modification time.
+        """
+        file_date = _date_from_name(entry.name)
+        if file_date is None:
+            file_date = datetime.fromtimestamp(entry.stat().st_mtime)
+        return from_date <= file_date <= to_date
 
-        if match:
+    def _dir_name_set(self, target_dir: str) -> set:
+        """Return the set of names in target_dir, scanning it only once."""
+        names = self._dir_names.get(target_dir)
+        if names is None:
             try:
-                year = int(match.group(1))
-                month = int(match.group(2))
-                day = int(match.group(3))
-                return datetime(year, month, day)
-            except ValueError:
-                pass
-
-        # Fall back to file modification time
-        return datetime.fromtimestamp(os.path.getmtime(file_path))
-
-    def is_in_date_range(self, file_path: str, from_date: datetime, to_date: datetime) -> bool:
-        """Check if file is within the specified date range."""
-        file_date = self.get_file_date(file_path)
-        return from_date <= file_date <= to_date
+                names = {e.name for e in os.scandir(target_dir)}
+            except FileNotFoundError:
+                names = set()
+            self._dir_names[target_dir] = names
+        return names
 
     def get_unique_filename(self, target_dir: str, filename: str) -> str:
         """Get a unique filename if there are conflicts."""
         name, ext = os.path.splitext(filename)
-        target_path = os.path.join(target_dir, filename)
+        names = self._dir_name_set(target_dir)
 
-        if not os.path.exists(target_path):
+        if filename not in names:
+            names.add(filename)
             return filename
 
         # For WhatsApp files, increment the WA number
@@ -148,28 +470,64 @@ class GatherImages:
                 # Find next available number
                 for num in range(current_num + 1, current_num + 1000):
                     new_name = f"{prefix}{num:04d}{ext}"
-                    if not os.path.exists(os.path.join(target_dir, new_name)):
+                    if new_name not in names:
+                        names.add(new_name)
                         return new_name
 
         # Generic approach: add number suffix
         counter = 1
-        while os.path.exists(os.path.join(target_dir, f"{name}_{counter}{ext}")):
+        while f"{name}_{counter}{ext}" in names:
             counter += 1
 
-        return f"{name}_{counter}{ext}"
+        new_name = f"{name}_{counter}{ext}"
+        names.add(new_name)
+        return new_name
 
-    def copy_file(self, src_path: str, dest_dir: str, new_filename: str):
-        """Copy file to destination with new filename."""
-        os.makedirs(dest_dir, exist_ok=True)
+    def scan_files(self, folder_path: str):
+        """Recursively yield os.DirEntry objects for all files below folder_path.
 
-        unique_filename = self.get_unique_filename(dest_dir, new_filename)
-        dest_path = os.path.join(dest_dir, unique_filename)
+        Unlike os.walk this keeps the DirEntry objects, whose cached stat
+        information avoids extra stat() syscalls later on.
+        """
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from self.scan_files(entry.path)
+                elif entry.is_file():
+                    yield entry
 
+    def copy_file(self, src_path: str, dest_dir: str, new_filename: str):
+        """Copy file to destination with new filename."""
+        # Create each destination directory only once, not per file
+        if dest_dir not in self._ensured_dirs:
+            os.makedirs(dest_dir, exist_ok=True)
+            self._ensured_dirs.add(dest_dir)
+
+        # Reserve the destination name while holding the lock so parallel
+        # copies can't race between the uniqueness probe and file creation
+        with self._dest_lock:
+            unique_filename = self.get_unique_filename(dest_dir, new_filename)
+            dest_path = os.path.join(dest_dir, unique_filename)
+            try:
+                fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+                os.close(fd)
+            except OSError as e:
+                print(f"Error creating {dest_path}: {e}")
+                return
+
+        if self._copy_pool is not None:
+            self._copy_pool.submit(self._do_copy, src_path, dest_path)
+        else:
+            self._do_copy(src_path, dest_path)
+
+    def _do_copy(self, src_path: str, dest_path: str):
+        """Perform the actual copy (runs on the copy pool)."""
         try:
-            shutil.copy2(src_path, dest_path)
+            fast_copy(src_path, dest_path)
             os.chmod(dest_path, 0o644)
-            print(f"Copied: {src_path} -> {dest_path}")
-            self.stats['processed'] += 1
+            self.log(f"Copied: {src_path} -> {dest_path}")
+            with self._stats_lock:
+                self.stats['processed'] += 1
         except Exception as e:
             print(f"Error copying {src_path} to {dest_path}: {e}")
 
@@ -184,47 +542,47 @@ class GatherImages:
 
             print(f"Processing {folder_type} folder: {folder_path}")
 
-            for root, dirs, files in os.walk(folder_path):
-                for filename in files:
-                    file_path = os.path.join(root, filename)
-                    file_ext = os.path.splitext(filename)[1].lower()
-
-                    # Skip non-media files
-                    if file_ext not in self.image_extensions and file_ext not in self.video_extensions:
-                        continue
-
-                    # Check date range
-                    if not self.is_in_date_range(file_path, from_date, to_date):
-                        continue
-
-                    # Check for duplicates
-                    if self.is_duplicate(file_path):
-                        print(f"Ignoring duplicate: {file_path}")
-                        continue
-
-                    # Clean filename
-                    clean_name = self.clean_filename(filename)
-
-                    # Validate filename format and warn if needed
-                    if not self.validate_filename_format(clean_name):
-                        self.warn(f"Warning: Filename doesn't match YYYYMMDD_HHMMSS format or has unexpected extension: {clean_name}")
-
-                    # Determine destination folder
-                    if folder_type == 'whatsapp_images':
-                        dest_dir = os.path.join(output_base, "Whatsapp-Bilder")
-                        self.stats['whatsapp_images'] += 1
-                    elif folder_type == 'whatsapp_videos':
-                        dest_dir = os.path.join(output_base, "Videos")
-                        self.stats['whatsapp_videos'] += 1
-                    elif file_ext in self.video_extensions:
-                        dest_dir = os.path.join(output_base, "Videos")
-                        self.stats['regular_videos'] += 1
-                    else:
-                        dest_dir = os.path.join(output_base, "Bilder")
-                        self.stats['regular_images'] += 1
-
-                    # Copy file
-                    self.copy_file(file_path, dest_dir, clean_name)
+            for entry in self.scan_files(folder_path):
+                filename = entry.name
+                file_path = entry.path
+                file_ext = os.path.splitext(filename)[1].lower()
+
+                # Skip non-media files
+                if file_ext not in self.image_extensions and file_ext not in self.video_extensions:
+                    continue
+
+                # Check date range
+                if not self.is_in_date_range(entry, from_date, to_date):
+                    continue
+
+                # Check for duplicates
+                if self.is_duplicate(entry):
+                    self.log(f"Ignoring duplicate: {file_path}")
+                    continue
+
+                # Clean filename
+                clean_name = self.clean_filename(filename)
+
+                # Validate filename format and warn if needed
+                if not self.validate_filename_format(clean_name):
+                    self.warn(f"Warning: Filename doesn't match YYYYMMDD_HHMMSS format or has unexpected extension: {clean_name}")
+
+                # Determine destination folder
+                if folder_type == 'whatsapp_images':
+                    dest_dir = os.path.join(output_base, "Whatsapp-Bilder")
+                    self.stats['whatsapp_images'] += 1
+                elif folder_type == 'whatsapp_videos':
+                    dest_dir = os.path.join(output_base, "Videos")
+                    self.stats['whatsapp_videos'] += 1
+                elif file_ext in self.video_extensions:
+                    dest_dir = os.path.join(output_base, "Videos")
+                    self.stats['regular_videos'] += 1
+                else:
+                    dest_dir = os.path.join(output_base, "Bilder")
+                    self.stats['regular_images'] += 1
+
+                # Copy file
+                self.copy_file(file_path, dest_dir, clean_name)
 
     def run(self, from_date: datetime, to_date: datetime):
         """Main execution method."""
@@ -240,6 +598,9 @@ class GatherImages:
             print(f"Error: Output directory '{output_path}' already exists. Exiting to avoid overwriting.")
             sys.exit(1)
 
+        # Reuse digests from previous runs over the same folders
+        self._open_hash_cache(output_base_dir)
+
         print(f"Output directory: {output_path}")
         # Create output directory structure
         os.makedirs(os.path.join(output_path, "Videos"), exist_ok=True)
@@ -253,14 +614,22 @@ class GatherImages:
             ('image_folders', 'image_folders')
         ]
 
-        for config_section, folder_type in folder_types:
-            if self.config.has_section(config_section):
-                folders = []
-                for key in self.config[config_section]:
-                    folders.append(self.config[config_section][key])
-
-                if folders:
-                    self.process_files(folders, folder_type, output_path, from_date, to_date)
+        with ThreadPoolExecutor(max_workers=self.jobs) as copy_pool, \
+                ThreadPoolExecutor(max_workers=os.cpu_count()) as hash_pool:
+            self._copy_pool = copy_pool
+            self._hash_pool = hash_pool
+            for config_section, folder_type in folder_types:
+                if self.config.has_section(config_section):
+                    folders = []
+                    for key in self.config[config_section]:
+                        folders.append(self.config[config_section][key])
+
+                    if folders:
+                        self.process_files(folders, folder_type, output_path, from_date, to_date)
+        self._copy_pool = None
+        self._hash_pool = None
+        self.flush_log()
+        self._close_hash_cache()
 
         # Print warnings
         if self.warnings:
@@ -317,6 +686,12 @@ def main():
         default='config.ini',
         help='Path to configuration file (default: config.ini)'
     )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=8,
+        help='Number of parallel copy threads (default: 8)'
+    )
 
     args = parser.parse_args()
 
@@ -351,7 +726,7 @@ base_folder = /path/to/output/directory
         sys.exit(1)
 
     try:
-        organizer = GatherImages(args.config)
+        organizer = GatherImages(args.config, jobs=args.jobs)
         organizer.run(args.from_date, args.to_date)
 
     except Exception as e: